@@ -1,7 +1,8 @@
 """Abstract Channel class."""
 import logging
+import weakref
 
-from ns import network as ns_net
+from ns import internet, network as ns_net
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,14 @@ class Channel:
         The nodes to connect on a physical channel.
     """
 
+    #: Nodes known to have an ns-3 IP stack installed.
+    #:
+    #: Channels must register every node they install a stack on here.
+    #: Stacks installed elsewhere are detected by :func:`has_ip_stack`.
+    _ip_stack_nodes = weakref.WeakSet()
+    #: The helper for installing IP stacks, shared by all channels.
+    __stack_helper = None
+
     def __init__(self, network, nodes):
         #: The network the channel belongs to.
         self.network = network
@@ -35,6 +44,44 @@ class Channel:
         for node in nodes:
             self.ns3_nodes_container.Add(node.ns3_node)
 
+    @staticmethod
+    def get_stack_helper():
+        """Return the helper for installing ns-3 IP stacks onto nodes.
+
+        The helper is created once and shared by all channels.
+
+        Returns
+        -------
+        ns.internet.InternetStackHelper
+            The stack helper.
+        """
+        if Channel.__stack_helper is None:
+            Channel.__stack_helper = internet.InternetStackHelper()
+        return Channel.__stack_helper
+
+    @staticmethod
+    def has_ip_stack(node):
+        """Check whether an ns-3 IP stack is installed on a node.
+
+        Nodes unknown to the channels are probed in ns-3 and remembered on a hit.
+
+        Parameters
+        ----------
+        node : :class:`.Node`
+            The node to check.
+
+        Returns
+        -------
+        bool
+            :code:`True` if the node already has an IP stack.
+        """
+        if node in Channel._ip_stack_nodes:
+            return True
+        if node.ns3_node.GetObject(internet.Ipv4.GetTypeId()) is not None:
+            Channel._ip_stack_nodes.add(node)
+            return True
+        return False
+
     @property
     def nodes(self):
         """Return all nodes of this channel.
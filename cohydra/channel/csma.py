@@ -4,7 +4,7 @@ import logging
 import ipaddress
 import os
 
-from ns import core, csma, internet, network as ns_net
+from ns import core, csma, network as ns_net
 
 from .channel import Channel
 from ..interface import Interface
@@ -46,23 +46,24 @@ class CSMAChannel(Channel):
         self.devices_container = self.csma_helper.Install(self.ns3_nodes_container)
 
         logger.info('Set IP addresses on nodes')
-        stack_helper = internet.InternetStackHelper()
+        stack_helper = Channel.get_stack_helper()
 
         for i, node in enumerate(nodes):
             ns3_device = self.devices_container.Get(i)
 
             address = None
             if node.wants_ip_stack():
-                if node.ns3_node.GetObject(internet.Ipv4.GetTypeId()) is None:
+                if not Channel.has_ip_stack(node):
                     logger.info('Installing IP stack on %s', node.name)
                     stack_helper.Install(node.ns3_node)
+                    Channel._ip_stack_nodes.add(node)
                 device_container = ns_net.NetDeviceContainer(ns3_device)
                 ip_address = self.network.address_helper.Assign(device_container).GetAddress(0)
                 netmask = network.network.prefixlen
                 address = ipaddress.ip_interface(f'{ip_address}/{netmask}')
 
             interface = Interface(node=node, ns3_device=ns3_device, address=address)
-            ns3_device.SetAddress(ns_net.Mac48Address(interface.mac_address))
+            ns3_device.SetAddress(interface.ns3_mac_address)
             node.add_interface(interface)
             self.interfaces.append(interface)
 
@@ -4,7 +4,7 @@ import logging
 import os
 
 from enum import Enum, unique
-from ns import core, internet, network as ns_net, wifi, wave, propagation
+from ns import core, network as ns_net, wifi, wave, propagation
 
 from .channel import Channel
 from ..interface import Interface
@@ -63,13 +63,14 @@ class WiFiChannel(Channel):
         WIFI_802_11p = wifi.WIFI_PHY_STANDARD_80211_10MHZ
 
     @unique
-    class WiFiDataRate(Enum):
+    class WiFiDataRate(str, Enum):
         """All available WiFi data rates.
 
         Choosing the correct and best data rate depends on the standard you are using.
         The data rate list is incomplete. Please consider reading the ns-3 source
         `here <https://gitlab.com/nsnam/ns-3-dev/blob/master/src/wifi/model/wifi-phy.cc>`_.
         You can pass another valid string to the channel, too.
+        Members are strings themselves and compare equal to their ns-3 mode name.
         """
         #: Use with :attr:`.WiFiStandard.WIFI_802_11a`.
         OFDM_RATE_6Mbps = "OfdmRate6Mbps"
@@ -209,11 +210,13 @@ class WiFiChannel(Channel):
         #: Helper for creating MAC layers.
         self.wifi_mac_helper = None
 
+        data_rate_value = _string_value_for(self.data_rate)
+
         if self.standard != WiFiChannel.WiFiStandard.WIFI_802_11p:
             self.wifi = wifi.WifiHelper()
             self.wifi.SetRemoteStationManager("ns3::ConstantRateWifiManager",
-                                              "DataMode", core.StringValue(self.data_rate.value),
-                                              "ControlMode", core.StringValue(self.data_rate.value))
+                                              "DataMode", data_rate_value,
+                                              "ControlMode", data_rate_value)
             self.wifi.SetStandard(self.standard.value)
 
             self.wifi_mac_helper = wifi.WifiMacHelper()
@@ -223,9 +226,9 @@ class WiFiChannel(Channel):
         else:
             self.wifi = wave.Wifi80211pHelper.Default()
             self.wifi.SetRemoteStationManager("ns3::ConstantRateWifiManager",
-                                              "DataMode", core.StringValue(self.data_rate.value),
-                                              "ControlMode", core.StringValue(self.data_rate.value),
-                                              "NonUnicastMode", core.StringValue(self.data_rate.value))
+                                              "DataMode", data_rate_value,
+                                              "ControlMode", data_rate_value,
+                                              "NonUnicastMode", data_rate_value)
             self.wifi_mac_helper = wave.NqosWaveMacHelper.Default()
 
         # Install on all connected nodes.
@@ -236,23 +239,39 @@ class WiFiChannel(Channel):
         self.devices_container = self.wifi.Install(self.wifi_phy_helper, self.wifi_mac_helper, self.ns3_nodes_container)
 
         logger.info('Setting IP addresses on nodes.')
-        stack_helper = internet.InternetStackHelper()
+        stack_helper = Channel.get_stack_helper()
+
+        ns3_devices = [self.devices_container.Get(i) for i in range(self.devices_container.GetN())]
 
-        for i, node in enumerate(nodes):
-            ns3_device = self.devices_container.Get(i)
+        # Install the IP stack and assign addresses in one go instead of once per device.
+        unstacked_nodes = []
+        unstacked_nodes_container = ns_net.NodeContainer()
+        ip_devices_container = ns_net.NetDeviceContainer()
+        for node, ns3_device in zip(nodes, ns3_devices):
+            if node.wants_ip_stack():
+                if not Channel.has_ip_stack(node):
+                    unstacked_nodes.append(node)
+                    unstacked_nodes_container.Add(node.ns3_node)
+                ip_devices_container.Add(ns3_device)
+        if unstacked_nodes:
+            logger.info('Installing IP stack on %d nodes: %s', len(unstacked_nodes),
+                        [node.name for node in unstacked_nodes[:8]])
+            stack_helper.Install(unstacked_nodes_container)
+            for node in unstacked_nodes:
+                Channel._ip_stack_nodes.add(node)
+        ip_interfaces_container = self.network.address_helper.Assign(ip_devices_container)
 
+        netmask = network.network.prefixlen
+        ip_index = 0
+        for node, ns3_device in zip(nodes, ns3_devices):
             address = None
             if node.wants_ip_stack():
-                if node.ns3_node.GetObject(internet.Ipv4.GetTypeId()) is None:
-                    logger.info('Installing IP stack on %s', node.name)
-                    stack_helper.Install(node.ns3_node)
-                device_container = ns_net.NetDeviceContainer(ns3_device)
-                ip_address = self.network.address_helper.Assign(device_container).GetAddress(0)
-                netmask = network.network.prefixlen
+                ip_address = ip_interfaces_container.GetAddress(ip_index)
+                ip_index += 1
                 address = ipaddress.ip_interface(f'{ip_address}/{netmask}')
 
             interface = Interface(node=node, ns3_device=ns3_device, address=address)
-            ns3_device.GetMac().SetAddress(ns_net.Mac48Address(interface.mac_address))
+            ns3_device.GetMac().SetAddress(interface.ns3_mac_address)
             node.add_interface(interface)
             self.interfaces.append(interface)
 
@@ -261,3 +280,28 @@ class WiFiChannel(Channel):
         for interface in self.interfaces:
             pcap_log_path = os.path.join(simulation.log_directory, interface.pcap_file_name)
             self.wifi_phy_helper.EnablePcap(pcap_log_path, interface.ns3_device, True, True)
+
+
+# ns-3 attribute values are copied on use, so they can be built once per data rate.
+_DATA_RATE_VALUES = {rate: core.StringValue(rate.value) for rate in WiFiChannel.WiFiDataRate}
+
+
+def _string_value_for(data_rate):
+    """Return the ns-3 attribute value for a data rate.
+
+    Values for :class:`.WiFiChannel.WiFiDataRate` members are cached.
+
+    Parameters
+    ----------
+    data_rate : :class:`.WiFiChannel.WiFiDataRate` or str
+        The data rate (mode name) to wrap.
+
+    Returns
+    -------
+    ns.core.StringValue
+        The ns-3 attribute value for the data rate.
+    """
+    value = _DATA_RATE_VALUES.get(data_rate)
+    if value is None:
+        value = core.StringValue(data_rate)
+    return value
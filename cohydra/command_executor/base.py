@@ -1,6 +1,7 @@
 """Base abstract class for a node."""
 
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +20,14 @@ class CommandExecutor:
         self.name = name
         #: A counter for loggers.
         self.counter = 0
+        #: A lock guarding :attr:`counter`, as commands may be executed from multiple workflows at once.
+        self.counter_lock = threading.Lock()
 
     def get_logger(self):
         """Retrieve the logger for this command executor."""
-        num = self.counter
-        self.counter += 1
+        with self.counter_lock:
+            num = self.counter
+            self.counter += 1
         return logging.getLogger(self.name).getChild(str(num))
 
     def execute(self, command, user=None, shell=None, stdout_logfile=None, stderr_logfile=None):
@@ -1,15 +1,43 @@
 """Execute commands over SSH."""
 import logging
-import threading
+import select
 from paramiko import SSHClient
 
 from . import util
 from .base import CommandExecutor
 
-def log_file(logger, level, file, logfile):
-    with file, util.LogFile(logger, logfile) as log:
-        for line in file:
-            log.log(level, line)
+#: The maximum number of bytes to receive from a channel at once.
+RECV_CHUNK_SIZE = 65536
+
+def log_lines(log, level, buffer, data):
+    buffer += data
+    *lines, rest = buffer.split(b'\n')
+    for line in lines:
+        log.log(level, line.decode('utf8', errors='replace').rstrip('\r\n'))
+    buffer[:] = rest
+
+def log_channel(logger, channel, stdout_logfile, stderr_logfile):
+    with util.LogFile(logger, stdout_logfile) as outlog, util.LogFile(logger, stderr_logfile) as errlog:
+        streams = (
+            (channel.recv_ready, channel.recv, outlog, logging.INFO, bytearray()),
+            (channel.recv_stderr_ready, channel.recv_stderr, errlog, logging.ERROR, bytearray()),
+        )
+        while True:
+            select.select([channel], [], [])
+            # Check before draining, data may still arrive right before the channel closes.
+            closed = channel.closed
+            for (ready, recv, log, level, buffer) in streams:
+                while ready():
+                    log_lines(log, level, buffer, recv(RECV_CHUNK_SIZE))
+            if closed:
+                # The channel (or transport) may close without sending an EOF.
+                break
+            if channel.eof_received and not channel.recv_ready() and not channel.recv_stderr_ready():
+                break
+
+        for (_, _, log, level, buffer) in streams:
+            if buffer:
+                log.log(level, buffer.decode('utf8', errors='replace').rstrip('\r\n'))
 
 class SSHCommandExecutor(CommandExecutor):
     """The SSHCommandExecutor runs commands on a SSH remote host.
@@ -37,15 +65,9 @@ class SSHCommandExecutor(CommandExecutor):
         
         logger = self.get_logger()
         logger.debug('%s', command)
-        (stdin, stdout, stderr) = self.client.exec_command(command)
+        (stdin, stdout, stderr) = self.client.exec_command(command, bufsize=RECV_CHUNK_SIZE, get_pty=False)
 
         stdin.close()
 
-        out_thread = threading.Thread(target=log_file, args=(logger, logging.INFO, stdout, stdout_logfile))
-        err_thread = threading.Thread(target=log_file, args=(logger, logging.ERROR, stderr, stderr_logfile))
-
-        out_thread.start()
-        err_thread.start()
-
-        out_thread.join()
-        err_thread.join()
+        with stdout, stderr:
+            log_channel(logger, stdout.channel, stdout_logfile, stderr_logfile)
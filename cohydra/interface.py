@@ -42,10 +42,14 @@ class Interface:
         self.ifname = None
         #: The MAC address of this interface.
         self.mac_address = mac_address
+        #: The ns-3 equivalent of the MAC address.
+        self.ns3_mac_address = None
         if self.mac_address is None:
-            allocated_mac = ns_net.Mac48Address.Allocate()
+            self.ns3_mac_address = ns_net.Mac48Address.Allocate()
             checker = ns_net.MakeMac48AddressChecker()
-            self.mac_address = ns_net.Mac48AddressValue(allocated_mac).SerializeToString(checker)
+            self.mac_address = ns_net.Mac48AddressValue(self.ns3_mac_address).SerializeToString(checker)
+        else:
+            self.ns3_mac_address = ns_net.Mac48Address(self.mac_address)
 
     def __interface_name(self, prefix):
         """Return the name of the interface.